@@ -2,15 +2,102 @@ import os
 import sys
 import fire
 import json
+import math
+import inspect
+import contextlib
+import functools
 import shutil
+import signal
+import socket
+import stat
 import struct
+import tempfile
+import types
 import typing as t
+from pathlib import Path
 
 from broadlink import hello
+from broadlink.const import DEFAULT_TIMEOUT
 import broadlink.exceptions as e
 from broadlink.device import Device
 from broadlink.exceptions import DataValidationError, NetworkTimeoutError
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+_MAGIC = bytes.fromhex("a5a55a5a")
+_LE_H = struct.Struct("<H")
+
+_MIN_TEMP = 16
+_MAX_TEMP = 30
+_CLAMP_TEMP = {i: max(_MIN_TEMP, min(i, _MAX_TEMP)) for i in range(-10, 60)}
+_CLAMP_HOURS = {i: i for i in range(24)}
+_CLAMP_MINUTES = {i: i for i in range(60)}
+
+class InvalidStateError(KeyError):
+    """
+    Raised when a setter is given a state it has no payload for.
+    """
+
+    def __init__(self, state: str, choices: t.Sequence[str]) -> None:
+        super().__init__(state)
+        self.state = state
+        self.choices = tuple(choices)
+
+    def __str__(self) -> str:
+        return f"Invalid value {self.state!r}. Choose one of: {', '.join(self.choices)}."
+
+class _Payloads(dict):
+    """
+    Maps setter states to precomputed payloads, raising InvalidStateError for unknown states.
+    """
+
+    def __missing__(self, state: str) -> bytes:
+        raise InvalidStateError(state, self)
+
+_POWER_PAYLOAD = _Payloads({"on": b'{"ac_pwr":1}', "off": b'{"ac_pwr":0}'})
+_MODE_PAYLOAD = _Payloads({
+    "auto": b'{"ac_mode":4}',
+    "cool": b'{"ac_mode":0}',
+    "heat": b'{"ac_mode":1}',
+    "dry": b'{"ac_mode":2}',
+    "fan": b'{"ac_mode":3}',
+    "heat_8": b'{"ac_mode":6}',
+})
+_FAN_PAYLOAD = _Payloads({
+    "auto": b'{"ac_mark":0}',
+    "low": b'{"ac_mark":1}',
+    "mid": b'{"ac_mark":2}',
+    "high": b'{"ac_mark":3}',
+    "turbo": b'{"ac_mark":4}',
+    "quiet": b'{"ac_mark":5}',
+})
+_SWING_PAYLOAD = _Payloads({"on": b'{"ac_vdir":1}', "off": b'{"ac_vdir":0}'})
+_LED_PAYLOAD = _Payloads({"on": b'{"scrdisp":1}', "off": b'{"scrdisp":0}'})
+_SLEEP_PAYLOAD = _Payloads({"on": b'{"ac_slp":1}', "off": b'{"ac_slp":0}'})
+_SELFCLEAN_PAYLOAD = _Payloads({"on": b'{"mldprf":1}', "off": b'{"mldprf":0}'})
+
+
+def _checksum(buf: bytes, start: int = 0x08) -> int:
+    """
+    Compute the JSON packet checksum over buf[start:], seeded with 0xC0AD.
+
+    Args:
+        buf (bytes): The packet to checksum.
+        start (int, optional): Offset the checksum starts at. Defaults to 0x08.
+
+    Returns:
+        int: The 16-bit checksum.
+    """
+    return sum(buf[start:], 0xC0AD) & 0xFFFF
+
 class Electrolux(Device):
     """
     Represents a controller for Electrolux air conditioners, providing methods to manage power, temperature, mode, fan, and other features.
@@ -20,7 +107,22 @@ class Electrolux(Device):
 
     def __init__(self, host: t.Tuple[str, int], mac: t.Union[bytes, str], devtype: int, timeout: int = ..., name: str = "", model: str = "", manufacturer: str = "", is_locked: bool = False) -> None:
         super().__init__(host, mac, devtype, timeout, name, model, manufacturer, is_locked)
-        self.auth()
+        self._authed = False
+
+    def auth(self) -> bool:
+        """
+        Authenticate to the device.
+
+        Called automatically by the first command sent, so constructing an Electrolux does no network I/O.
+
+        Returns:
+            bool: True if authentication succeeded.
+
+        Raises:
+            broadlink.exceptions.AuthenticationError: If the device rejects the handshake.
+        """
+        self._authed = super().auth()
+        return self._authed
 
     def _send(self, command: int, data: bytes = b"") -> bytes:
         """
@@ -36,35 +138,49 @@ class Electrolux(Device):
         Raises:
             broadlink.exceptions.BroadlinkException: If the response checksum is invalid or an error is detected.
         """
-        packet = bytearray(0xD)
-        packet[0x00:0x02] = command.to_bytes(2, "little")
-        packet[0x02:0x06] = bytes.fromhex("a5a55a5a")
+        if not self._authed:
+            self.auth()
+
+        packet = bytearray(0xE + len(data))
+        _LE_H.pack_into(packet, 0x00, command)
+        packet[0x02:0x06] = _MAGIC
 
         packet[0x08] = 0x01 if len(data) <= 2 else 0x02
         packet[0x09] = 0x0b
-        packet[0xA:0xB] = len(data).to_bytes(2, "little")
+        _LE_H.pack_into(packet, 0x0A, len(data))
+        packet[0xE:] = data
 
-        packet.extend(data)
-
-        d_checksum = sum(packet[0x08:], 0xC0AD) & 0xFFFF
-        packet[0x06:0x08] = d_checksum.to_bytes(2, "little")
+        _LE_H.pack_into(packet, 0x06, _checksum(packet))
 
         resp = self.send_packet(0x6A, packet)
         e.check_error(resp[0x22:0x24])
         dcry = self.decrypt(resp[0x38:])
 
-        r_checksum = sum(dcry[0x08:], 0xC0AD) & 0xFFFF
-        r_response = struct.unpack("h", dcry[0x06:0x08])[0]
+        r_checksum = _checksum(dcry)
+        r_response = _LE_H.unpack_from(dcry, 0x06)[0]
 
         if r_checksum != r_response:
             raise e.BroadlinkException(DataValidationError, "Failed to validate JSON checksum.")
 
-        r_length = struct.unpack("h", dcry[0xA:0xC])[0]
+        r_length = _LE_H.unpack_from(dcry, 0x0A)[0]
 
         payload = dcry[0xE:0xE + r_length]
 
         return payload
 
+    def _apply(self, command: int, payload: bytes) -> str:
+        """
+        Send a command and return the device's response decoded as ASCII.
+
+        Args:
+            command (int): The command code to send.
+            payload (bytes): The JSON payload to send.
+
+        Returns:
+            str: The response from the device.
+        """
+        return self._send(command, payload).decode("ascii")
+
     def status(self) -> str:
         """
         Get the current status of the air conditioner as a JSON string.
@@ -72,24 +188,24 @@ class Electrolux(Device):
         Returns:
             str: The status response from the device.
         """
-        resp = self._send(0x0e, bytearray('{}', "ascii"))
-        return str(resp, "ascii")
+        return self._apply(0x0e, b"{}")
 
     def temp(self, temp: int) -> str:
         """
         Set the target temperature of the air conditioner.
 
+        Only whole degrees are sent. Fractional values are rounded half up (22.4 becomes 22,
+        22.5 and 22.6 become 23), then clamped to 16-30.
+
         Args:
             temp (int): The desired temperature to set.
 
         Returns:
             str: The response from the device after setting the temperature.
         """
-        max_temp = 30
-        min_temp = 16
-        temp = max(min_temp, min(temp, max_temp))
-        resp = self._send(0x17, bytearray('{"temp":%s}' % temp, "ascii"))
-        return str(resp, "ascii")
+        temp = math.floor(temp + 0.5)
+        temp = _CLAMP_TEMP[temp] if temp in _CLAMP_TEMP else max(_MIN_TEMP, min(temp, _MAX_TEMP))
+        return self._apply(0x17, b'{"temp":%d}' % temp)
 
     def power(self, power: str) -> str:
         """
@@ -100,10 +216,11 @@ class Electrolux(Device):
 
         Returns:
             str: The response from the device after setting the power state.
+
+        Raises:
+            InvalidStateError: If power is not a supported power state.
         """
-        power_states = {"on": 1, "off": 0}
-        resp = self._send(0x18, bytearray('{"ac_pwr":%s}'%(power_states.get(power)), "ascii"))
-        return str(resp, "ascii")
+        return self._apply(0x18, _POWER_PAYLOAD[power])
 
     def mode(self, mode: str) -> str:
         """
@@ -114,10 +231,11 @@ class Electrolux(Device):
 
         Returns:
             str: The response from the device after setting the mode.
+
+        Raises:
+            InvalidStateError: If mode is not a supported mode.
         """
-        modes = {"auto": 4, "cool": 0, "heat": 1, "dry": 2, "fan": 3, "heat_8": 6}
-        resp = self._send(0x19, bytearray('{"ac_mode":%s}'%(modes.get(mode)), "ascii"))
-        return str(resp, "ascii")
+        return self._apply(0x19, _MODE_PAYLOAD[mode])
 
     def fan(self, fan_level: str) -> str:
         """
@@ -128,10 +246,11 @@ class Electrolux(Device):
 
         Returns:
             str: The response from the device after setting the fan speed.
+
+        Raises:
+            InvalidStateError: If fan_level is not a supported fan level.
         """
-        fan_levels = {"auto": 0, "low": 1, "mid": 2, "high": 3, "turbo": 4, "quiet": 5}
-        resp = self._send(0x19, bytearray('{"ac_mark":%s}'%(fan_levels.get(fan_level)), "ascii"))
-        return str(resp, "ascii")
+        return self._apply(0x19, _FAN_PAYLOAD[fan_level])
 
     def swing(self, swing_state: str) -> str:
         """
@@ -142,10 +261,11 @@ class Electrolux(Device):
 
         Returns:
             str: The response from the device after setting the swing state.
+
+        Raises:
+            InvalidStateError: If swing_state is not a supported swing state.
         """
-        swing_states = {"on": 1, "off": 0}
-        resp = self._send(0x19, bytearray('{"ac_vdir":%s}'%(swing_states.get(swing_state)), "ascii"))
-        return str(resp, "ascii")
+        return self._apply(0x19, _SWING_PAYLOAD[swing_state])
 
     def led(self, led_state: str) -> str:
         """
@@ -156,10 +276,11 @@ class Electrolux(Device):
 
         Returns:
             str: The response from the device after setting the LED state.
+
+        Raises:
+            InvalidStateError: If led_state is not a supported LED state.
         """
-        led_states = {"on": 1, "off": 0}
-        resp = self._send(0x19, bytearray('{"scrdisp":%s}'%(led_states.get(led_state)), "ascii"))
-        return str(resp, "ascii")
+        return self._apply(0x19, _LED_PAYLOAD[led_state])
 
     def sleep(self, sleep_state: str) -> str:
         """
@@ -170,10 +291,11 @@ class Electrolux(Device):
 
         Returns:
             str: The response from the device after setting the sleep mode.
+
+        Raises:
+            InvalidStateError: If sleep_state is not a supported sleep state.
         """
-        sleep_states = {"on": 1, "off": 0}
-        resp = self._send(0x18, bytearray('{"ac_slp":%s}'%(sleep_states.get(sleep_state)), "ascii"))
-        return str(resp, "ascii")
+        return self._apply(0x18, _SLEEP_PAYLOAD[sleep_state])
 
     def selfclean(self, clean_state: str) -> str:
         """
@@ -184,10 +306,11 @@ class Electrolux(Device):
 
         Returns:
             str: The response from the device after setting the self-cleaning mode.
+
+        Raises:
+            InvalidStateError: If clean_state is not a supported self-cleaning state.
         """
-        clean_states = {"on": 1, "off": 0}
-        resp = self._send(0x18, bytearray('{"mldprf":%s}'%(clean_states.get(clean_state)), "ascii"))
-        return str(resp, "ascii")
+        return self._apply(0x18, _SELFCLEAN_PAYLOAD[clean_state])
 
     def timer(self, on_timer: bool, hours: int, minutes: int) -> str:
         """
@@ -201,10 +324,9 @@ class Electrolux(Device):
         Returns:
             str: The response from the device after setting the timer.
         """
-        hours = max(0, min(hours, 23))
-        minutes = max(0, min(minutes, 59))
-        resp = self._send(0x1f, bytearray('{"timer":"%02d%02d|0%s"}'%(hours,minutes,1 if on_timer else 0), "ascii"))
-        return str(resp, "ascii")
+        hours = _CLAMP_HOURS[hours] if hours in _CLAMP_HOURS else max(0, min(hours, 23))
+        minutes = _CLAMP_MINUTES[minutes] if minutes in _CLAMP_MINUTES else max(0, min(minutes, 59))
+        return self._apply(0x1f, b'{"timer":"%02d%02d|0%d"}' % (hours, minutes, 1 if on_timer else 0))
 
     def clear_timer(self, on_timer: bool) -> str:
         """
@@ -219,38 +341,388 @@ class Electrolux(Device):
         resp = self.timer(on_timer, 0, 0)
         return resp
 
-def main():
-    home_config_path = os.path.expanduser('~/.electrolux_ac_config.json')
+COMMANDS = ("status", "temp", "power", "mode", "fan", "swing", "led", "sleep", "selfclean", "timer", "clear_timer")
+
+@functools.lru_cache(maxsize=1)
+def _load_config(path: str, mtime_ns: int) -> t.Mapping[str, t.Any]:
+    return types.MappingProxyType(_json_loads(Path(path).read_bytes()))
+
+def load_config(path: str) -> t.Mapping[str, t.Any]:
+    """
+    Load the JSON config file, reusing the parsed result until the file is modified.
+
+    Args:
+        path (str): Path of the config file.
+
+    Returns:
+        Mapping[str, Any]: A read-only view of the config.
+    """
+    return _load_config(path, os.stat(path).st_mtime_ns)
+
+def _write_config(path: str, config: t.Mapping[str, t.Any]) -> None:
+    """
+    Write the config file atomically, so concurrent readers never see it truncated or half-written.
+
+    The JSON goes to a temporary file in the same directory, which then replaces the config.
+
+    Args:
+        path (str): Path of the config file.
+        config (Mapping[str, Any]): The config to write.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix='.electrolux_ac_config.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(dict(config), f, indent=2)
+        with contextlib.suppress(FileNotFoundError):
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+
+def _discover(config: t.Mapping[str, t.Any], config_path: str) -> Electrolux:
+    """
+    Discover the device with a hello() probe and cache its identity in the config file.
+
+    Args:
+        config (Mapping[str, Any]): The loaded config.
+        config_path (str): Path the updated config is written back to.
+
+    Returns:
+        Electrolux: A controller for the discovered device.
+    """
+    device = hello(ip_address=config.get('ip_address', '10.0.0.100'))
+    config = dict(config, host=device.host[0], port=device.host[1], mac=device.mac.hex(), devtype=hex(device.devtype))
+    _write_config(config_path, config)
+    return Electrolux(
+        host=device.host,
+        mac=device.mac,
+        devtype=device.devtype,
+        timeout=device.timeout,
+        name=device.name,
+        model="",
+        manufacturer="Electrolux",
+        is_locked=device.is_locked
+    )
+
+def _connect(config: t.Mapping[str, t.Any], config_path: str) -> Electrolux:
+    """
+    Connect to the device, using the cached identity from the config when present.
+
+    Falls back to discovery if nothing is cached, the cache was discovered at a different
+    ip_address, or the cached identity fails to authenticate.
+
+    Args:
+        config (Mapping[str, Any]): The loaded config.
+        config_path (str): Path of the config file, rewritten when the device is rediscovered.
+
+    Returns:
+        Electrolux: A controller for the device. A cached device is authenticated up front;
+        a rediscovered one authenticates on its first command.
+    """
+    ip_address = config.get('ip_address', '10.0.0.100')
+    if config.get('host') == ip_address and all(key in config for key in ('port', 'mac', 'devtype')):
+        device = Electrolux(
+            host=(ip_address, config['port']),
+            mac=bytes.fromhex(config['mac']),
+            devtype=int(config['devtype'], 16),
+            timeout=DEFAULT_TIMEOUT,
+            manufacturer="Electrolux"
+        )
+        try:
+            device.auth()
+            return device
+        except e.AuthenticationError:
+            pass
+    return _discover(config, config_path)
+
+# A live daemon answers a ping immediately; a command may need a re-auth plus the command itself
+_DAEMON_CONNECT_TIMEOUT = 1.0
+_DAEMON_REPLY_TIMEOUT = 3 * DEFAULT_TIMEOUT
+
+class DaemonError(Exception):
+    """
+    Raised when elux-daemon reports that a forwarded command failed.
+    """
+
+class _DaemonClient:
+    """
+    Forwards Electrolux commands to a running elux-daemon over its Unix socket.
+    """
+
+    def __init__(self, conn: socket.socket) -> None:
+        self._conn = conn
+        self._stream = conn.makefile('rwb')
+
+    def _request(self, request: t.Mapping[str, t.Any]) -> t.Mapping[str, t.Any]:
+        self._stream.write(json.dumps(request).encode() + b"\n")
+        self._stream.flush()
+        line = self._stream.readline()
+        if not line:
+            raise DaemonError("Daemon closed the connection.")
+        reply = _json_loads(line)
+        if not isinstance(reply, dict):
+            raise ValueError("Reply is not a JSON object.")
+        return reply
+
+    def ping(self) -> bool:
+        """
+        Check that the daemon is actually serving requests, not just accepting connections.
+
+        Returns:
+            bool: True if the daemon answered.
+        """
+        return self._request({"method": "ping"}).get("result") == "pong"
+
+    def __getattr__(self, name: str) -> t.Callable[..., str]:
+        if name not in COMMANDS:
+            raise AttributeError(name)
+
+        def call(*args, **kwargs):
+            try:
+                reply = self._request({"method": name, "args": args, "kwargs": kwargs})
+            except socket.timeout:
+                raise DaemonError("Timed out waiting for elux-daemon.") from None
+            except OSError as exc:
+                raise DaemonError(f"Lost connection to elux-daemon: {exc}") from None
+            except ValueError as exc:
+                raise DaemonError(f"Malformed reply from elux-daemon: {exc}") from None
+            if "choices" in reply:
+                raise InvalidStateError(reply.get("state"), reply["choices"])
+            if "error" in reply:
+                raise DaemonError(reply["error"])
+            if "result" not in reply:
+                raise DaemonError("Malformed reply from elux-daemon: no result.")
+            return reply["result"]
+
+        return call
+
+def _daemon_socket_path() -> str:
+    return f"/tmp/elux-{os.getuid()}.sock"
+
+def _daemon_pid_path() -> str:
+    return f"/tmp/elux-{os.getuid()}.pid"
+
+def _lock_daemon_pidfile() -> int:
+    """
+    Take the single-instance lock for elux-daemon and record our pid in the pidfile.
+
+    The lock is an flock on the pidfile, held for the life of the process; the kernel releases it
+    when the daemon exits, however it exits.
+
+    Returns:
+        int: The pidfile's file descriptor, which must stay open while the daemon runs.
+
+    Raises:
+        BlockingIOError: If another elux-daemon holds the lock.
+        PermissionError: If the pidfile exists but belongs to another user.
+    """
+    fd = os.open(_daemon_pid_path(), os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+    try:
+        if os.fstat(fd).st_uid != os.getuid():
+            raise PermissionError(f"{_daemon_pid_path()} is owned by another user.")
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        os.ftruncate(fd, 0)
+        os.write(fd, f"{os.getpid()}\n".encode())
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+def _daemon_client() -> t.Optional[_DaemonClient]:
+    """
+    Connect to a running elux-daemon.
+
+    A daemon that doesn't answer a ping within _DAEMON_CONNECT_TIMEOUT is treated as absent,
+    so a wedged daemon makes elux fall back to a direct connection instead of hanging. So is
+    anything at the socket path that isn't a socket owned by the current user, since any local
+    user can create files in /tmp.
+
+    Returns:
+        Optional[_DaemonClient]: A client for the daemon, or None if no usable daemon is serving.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    socket_path = _daemon_socket_path()
+    try:
+        st = os.lstat(socket_path)
+    except OSError:
+        return None
+    if not stat.S_ISSOCK(st.st_mode) or st.st_uid != os.getuid():
+        return None
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    conn.settimeout(_DAEMON_CONNECT_TIMEOUT)
+    try:
+        conn.connect(socket_path)
+        client = _DaemonClient(conn)
+        if not client.ping():
+            raise DaemonError("Unexpected reply to ping.")
+    except (OSError, DaemonError, ValueError):
+        conn.close()
+        return None
+    conn.settimeout(_DAEMON_REPLY_TIMEOUT)
+    return client
+
+def _handle(device: Electrolux, line: bytes) -> bytes:
+    """
+    Run one newline-delimited JSON request from a daemon client against the device.
+
+    Args:
+        device (Electrolux): The daemon's controller.
+        line (bytes): A request such as {"method": "temp", "args": [22]}.
+
+    Returns:
+        bytes: The JSON reply line, holding either "result" or "error".
+    """
+    try:
+        request = _json_loads(line)
+        method = request.get("method")
+        if method == "ping":
+            return b'{"result": "pong"}\n'
+        if method not in COMMANDS:
+            raise ValueError(f"Unknown command: {method}")
+        reply = {"result": getattr(device, method)(*request.get("args", ()), **request.get("kwargs", {}))}
+    except InvalidStateError as exc:
+        reply = {"error": str(exc), "state": exc.state, "choices": exc.choices}
+    except e.BroadlinkException as exc:
+        # The session may be gone (e.g. the unit rebooted), so authenticate again on the next command
+        device._authed = False
+        reply = {"error": str(exc)}
+    except Exception as exc:
+        reply = {"error": f"{type(exc).__name__}: {exc}"}
+    return json.dumps(reply).encode() + b"\n"
+
+def _command(name: str, connect: t.Callable[[], t.Union[Electrolux, _DaemonClient]]) -> t.Callable[..., str]:
+    """
+    Wrap an Electrolux method so Fire can expose it without a connected device.
+
+    The wrapper carries the method's docstring and signature (minus self), so help and argument
+    parsing work without touching the network; the device is only connected when the command runs.
+
+    Args:
+        name (str): Name of the Electrolux method to expose.
+        connect (Callable[[], Electrolux | _DaemonClient]): Returns the controller or daemon client to run the command on.
+
+    Returns:
+        Callable[..., str]: The Fire command.
+    """
+    method = getattr(Electrolux, name)
+
+    @functools.wraps(method)
+    def command(*args, **kwargs):
+        return getattr(connect(), name)(*args, **kwargs)
+
+    signature = inspect.signature(method)
+    command.__signature__ = signature.replace(parameters=list(signature.parameters.values())[1:])
+    return command
+
+def _read_config(config_path: str) -> t.Mapping[str, t.Any]:
+    """
+    Load the config, creating a placeholder and exiting if it doesn't exist yet.
+
+    Args:
+        config_path (str): Path of the config file.
+
+    Returns:
+        Mapping[str, Any]: The loaded config.
+    """
     default_config = {"ip_address": "10.0.0.100"}
-    if not os.path.exists(home_config_path):
+    if not os.path.exists(config_path):
         # Create a placeholder config in the user's home directory if it doesn't exist
-        with open(home_config_path, 'w') as f:
-            json.dump(default_config, f, indent=2)
-        print(f"Created default config file at {home_config_path}. Please edit it with your device's IP address.")
+        _write_config(config_path, default_config)
+        print(f"Created default config file at {config_path}. Please edit it with your device's IP address.")
         sys.exit(0)
-    with open(home_config_path, 'r') as f:
-        config = json.load(f)
-    ip_address = config.get('ip_address', '10.0.0.100')
+    return load_config(config_path)
+
+@contextlib.contextmanager
+def _exit_on_error(ip_address: str) -> t.Iterator[None]:
     try:
-        device = hello(ip_address=ip_address)
-        fire.Fire(
-            Electrolux(
-                host=device.host,
-                mac=device.mac,
-                devtype=device.devtype,
-                timeout=device.timeout,
-                name=device.name,
-                model="",
-                manufacturer="Electrolux",
-                is_locked=device.is_locked
-            )
-        )
+        yield
     except NetworkTimeoutError:
         print(f"Failed to connect to device at {ip_address}. Please check the IP address and network connection.")
         sys.exit(1)
     except e.BroadlinkException as exc:
         print(f"Error connecting to device: {exc}")
         sys.exit(1)
+    except DaemonError as exc:
+        print(f"Daemon error: {exc}")
+        sys.exit(1)
+    except InvalidStateError as exc:
+        print(exc)
+        sys.exit(1)
+
+def main():
+    home_config_path = os.path.expanduser('~/.electrolux_ac_config.json')
+    config = _read_config(home_config_path)
+    ip_address = config.get('ip_address', '10.0.0.100')
+    with _exit_on_error(ip_address):
+        connect = functools.lru_cache(maxsize=1)(lambda: _daemon_client() or _connect(config, home_config_path))
+        fire.Fire({name: _command(name, connect) for name in COMMANDS})
+
+def daemon():
+    """
+    Keep one authenticated session open and serve commands from elux over a Unix socket.
+    """
+    if not hasattr(socket, "AF_UNIX") or fcntl is None:
+        print("elux-daemon requires Unix domain socket and flock support.")
+        sys.exit(1)
+    home_config_path = os.path.expanduser('~/.electrolux_ac_config.json')
+    config = _read_config(home_config_path)
+    socket_path = _daemon_socket_path()
+    try:
+        pid_fd = _lock_daemon_pidfile()
+    except BlockingIOError:
+        print(f"elux-daemon is already running (see {_daemon_pid_path()}).")
+        sys.exit(1)
+    except OSError as exc:
+        print(f"Cannot lock {_daemon_pid_path()}: {exc}")
+        sys.exit(1)
+    # Holding the lock means any existing socket is left over from a daemon that died
+    try:
+        st = os.lstat(socket_path)
+    except FileNotFoundError:
+        pass
+    else:
+        if not stat.S_ISSOCK(st.st_mode) or st.st_uid != os.getuid():
+            print(f"Refusing to replace {socket_path}: it is not a socket owned by this user.")
+            sys.exit(1)
+        os.unlink(socket_path)
+    with _exit_on_error(config.get('ip_address', '10.0.0.100')):
+        device = _connect(config, home_config_path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        umask = os.umask(0o177)
+        try:
+            server.bind(socket_path)
+        finally:
+            os.umask(umask)
+        socket_inode = os.lstat(socket_path).st_ino
+        server.listen()
+        print(f"Listening on {socket_path}")
+        # Route SIGTERM through the finally below so the socket file is removed on a plain kill
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        try:
+            while True:
+                conn, _ = server.accept()
+                # Don't let an idle or stuck client block every other elux call
+                conn.settimeout(_DAEMON_REPLY_TIMEOUT)
+                try:
+                    with conn, conn.makefile('rwb') as stream:
+                        for line in stream:
+                            stream.write(_handle(device, line))
+                            stream.flush()
+                except OSError:
+                    # The client went away or stalled (including while the reply is flushed on close);
+                    # drop only this connection and keep serving
+                    pass
+        except KeyboardInterrupt:
+            pass
+        finally:
+            # Only remove the socket if it is still the one we bound
+            with contextlib.suppress(FileNotFoundError):
+                if os.lstat(socket_path).st_ino == socket_inode:
+                    os.unlink(socket_path)
+            os.close(pid_fd)
 
 if __name__ == '__main__':
     main()
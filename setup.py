@@ -12,7 +12,8 @@ setup(
     ],
     entry_points={
         "console_scripts": [
-            "elux=electrolux.cli:main"
+            "elux=electrolux.cli:main",
+            "elux-daemon=electrolux.cli:daemon"
         ]
     },
     python_requires=">=3.7",